@@ -0,0 +1,89 @@
+import time
+import tracemalloc
+
+from main import (
+    VARSAYILAN_KAYNAK_KOD,
+    SozdizimRenklendiricisi,
+    SozdizimCozumleyicisi,
+    DuzSozdizimCozumleyicisi,
+)
+
+
+# Örnek kodun kaç kez tekrarlanacağı
+TEKRAR_SAYILARI = [10, 100, 1000]
+
+# Leksikal çözümleyici karşılaştırması için hedef boyutlar (MB)
+LEKSIKAL_BOYUTLARI = [1, 4, 16]
+
+
+def olcum_yap(islev):
+    """İşlevi çalıştırır; süre (sn), tepe bellek (bayt) ve sonucu döndürür"""
+    # Süre, tracemalloc yükü olmadan ayrı bir çalıştırmada ölçülür
+    baslangic = time.perf_counter()
+    sonuc = islev()
+    sure = time.perf_counter() - baslangic
+
+    tracemalloc.start()
+    islev()
+    _, tepe = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return sure, tepe, sonuc
+
+
+def agaci_duzlestir(dugum):
+    """Ağacı karşılaştırılabilir iç içe demetlere çevirir"""
+    return (dugum.kategori, dugum.deger, [agaci_duzlestir(alt) for alt in dugum.alt_dugumler])
+
+
+def cozumleyicileri_karsilastir():
+    """Nesne tabanlı ve düz (arena) sözdizimi ağaçlarını karşılaştırır"""
+    renklendirici = SozdizimRenklendiricisi(None)
+
+    print("Sözdizimi ağacı: nesne tabanlı / düz (arena)")
+    print(f"{'Boyut (KB)':>10} {'Birim':>9} {'Süre (sn)':>19} {'Tepe bellek (MB)':>21}")
+    for tekrar in TEKRAR_SAYILARI:
+        kaynak_metin = VARSAYILAN_KAYNAK_KOD * tekrar
+        birimler = list(renklendirici.metni_ayristir(kaynak_metin))
+
+        nesne_suresi, nesne_bellegi, nesne_koku = olcum_yap(lambda: SozdizimCozumleyicisi(birimler).cozumle())
+        duz_suresi, duz_bellegi, duz_koku = olcum_yap(lambda: DuzSozdizimCozumleyicisi(birimler).kok_dugumu_cozumle())
+
+        if agaci_duzlestir(nesne_koku) != agaci_duzlestir(duz_koku):
+            raise AssertionError("Nesne tabanlı ve düz sözdizimi ağaçları farklı")
+
+        print(f"{len(kaynak_metin.encode()) / 1024:>10.0f} {len(birimler):>9} "
+              f"{nesne_suresi:>9.3f} / {duz_suresi:<7.3f} "
+              f"{nesne_bellegi / 2**20:>9.2f} / {duz_bellegi / 2**20:<9.2f}")
+
+
+def leksikal_yontemleri_karsilastir():
+    """Düzenli ifade ve karakter sınıfı tablosu tabanlı leksikal çözümleyicileri karşılaştırır"""
+    renklendirici = SozdizimRenklendiricisi(None)
+    ornek_boyutu = len(VARSAYILAN_KAYNAK_KOD.encode())
+
+    print("Leksikal çözümleme: düzenli ifade / tablo")
+    print(f"{'Boyut (MB)':>10} {'Birim':>9} {'Süre (sn)':>19} {'MB/sn':>17}")
+    for boyut in LEKSIKAL_BOYUTLARI:
+        kaynak_metin = VARSAYILAN_KAYNAK_KOD * (boyut * 2**20 // ornek_boyutu)
+
+        sureler = {}
+        sonuclar = {}
+        for yontem in ("duzenli_ifade", "tablo"):
+            renklendirici.leksikal_yontem = yontem
+            baslangic = time.perf_counter()
+            sonuclar[yontem] = list(renklendirici.metni_ayristir(kaynak_metin))
+            sureler[yontem] = time.perf_counter() - baslangic
+
+        if sonuclar["duzenli_ifade"] != sonuclar["tablo"]:
+            raise AssertionError("Leksikal çözümleyicilerin çıktıları farklı")
+
+        mb = len(kaynak_metin.encode()) / 2**20
+        print(f"{mb:>10.1f} {len(sonuclar['tablo']):>9} "
+              f"{sureler['duzenli_ifade']:>9.2f} / {sureler['tablo']:<7.2f} "
+              f"{mb / sureler['duzenli_ifade']:>7.2f} / {mb / sureler['tablo']:<7.2f}")
+
+
+if __name__ == "__main__":
+    cozumleyicileri_karsilastir()
+    print()
+    leksikal_yontemleri_karsilastir()
@@ -1,11 +1,64 @@
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, scrolledtext, messagebox, filedialog
+import codecs
+import mmap
+import os
 import re
-from typing import Dict, List, Tuple, Optional
+from array import array
+from typing import Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass
 from enum import Enum, auto
 
 
+# Editöre ilk açılışta yüklenen örnek C kaynak kodu
+VARSAYILAN_KAYNAK_KOD = '''// Bu satır tek satırlık açıklama içerir
+/* Aşağıdaki blok
+   çoklu satır
+   açıklama örneğidir */
+
+#include <stdio.h>
+#include <stdlib.h>
+
+char ileti[] = "Selam Dünya!";
+int deger = 42;
+float pi_sayisi = 3.14159;
+char harf = 'X';
+
+int islev_calistir(int a, float b) {
+    if (a > 0 && b < 100.0) {
+        char durum[] = "Olumlu";
+        return a + (int)b;
+    } else {
+        while (a != 0) {
+            a = a - 1;
+            b = b * 2.0;
+        }
+        for (int j = 0; j < 10; j++) {
+            float toplam = a + b;
+            if (toplam >= 50.0) {
+                break;
+            }
+        }
+    }
+    return 0;
+}
+
+int main() {
+    int sonuc = islev_calistir(5, 10.5);
+    printf("Çıktı: %d\\n", sonuc);
+    return 0;
+}
+'''
+
+# Büyük dosya yükleme ve arka plan çözümleme ayarları
+DOSYA_PARCA_BOYUTU = 256 * 1024     # Her adımda okunup editöre eklenen bayt sayısı
+ANALIZ_PARCA_BOYUTU = 64 * 1024     # Her arka plan adımında çözümlenen karakter sayısı
+ILK_GORUNUM_BOYUTU = 16 * 1024      # Yükleme başlarken hemen renklendirilen karakter sayısı
+BUYUK_METIN_SINIRI = 100 * 1024     # Bu boyutun üzerindeki metinler arka planda çözümlenir
+ERTELEME_SURESI_MS = 300            # Büyük metinlerde son tuş vuruşundan sonra çözümlemeye kadar beklenen süre
+GORUNUM_BIRIM_SINIRI = 20000        # Yardımcı pencerelerde gösterilen en fazla leksikal birim sayısı
+
+
 # Leksikal kategoriler
 class LeksikolTip(Enum):
     REZERVE_KELIME = auto()
@@ -29,6 +82,248 @@ class LeksikolBirim:
     icerik: str                  # Leksikal birimin gerçek metin değeri
 
 
+# Karakter sınıfları: her sınıf, o karakterle başlayabilecek kategorileri belirler
+class KarakterSinifi(Enum):
+    DIGER = auto()      # Hiçbir kategoriyi başlatamaz, atlanır
+    BOSLUK = auto()
+    HARF = auto()       # a-z, A-Z, _
+    RAKAM = auto()
+    CIFT_TIRNAK = auto()
+    TEK_TIRNAK = auto()
+    BOLU = auto()       # Açıklama veya işlemci
+    DIYEZ = auto()
+    ISLEMCI = auto()
+    AYRAC = auto()
+
+
+def _karakter_sinifini_bul(karakter: str) -> KarakterSinifi:
+    """Tek bir karakterin sınıfını düzenli ifade kalıplarıyla uyumlu biçimde belirler"""
+    if karakter.isspace():
+        return KarakterSinifi.BOSLUK
+    if karakter == "_" or ("a" <= karakter <= "z") or ("A" <= karakter <= "Z"):
+        return KarakterSinifi.HARF
+    if karakter.isdecimal():  # \d gibi Unicode onluk rakamları da kapsar
+        return KarakterSinifi.RAKAM
+    if karakter == '"':
+        return KarakterSinifi.CIFT_TIRNAK
+    if karakter == "'":
+        return KarakterSinifi.TEK_TIRNAK
+    if karakter == "/":
+        return KarakterSinifi.BOLU
+    if karakter == "#":
+        return KarakterSinifi.DIYEZ
+    if karakter in "+-*%=<>!&|^~?:":
+        return KarakterSinifi.ISLEMCI
+    if karakter in "(){}[];,.":
+        return KarakterSinifi.AYRAC
+    return KarakterSinifi.DIGER
+
+
+# İlk 256 karakter için önceden hesaplanmış sınıf tablosu
+KARAKTER_SINIFI_TABLOSU = [_karakter_sinifini_bul(chr(kod)) for kod in range(256)]
+
+# [a-zA-Z0-9_]: tanımlayıcıların devamında kullanılabilen karakterler
+KIMLIK_KARAKTERLERI = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
+
+# İki karakterli işlemciler; tek karakterlilerden önce denenir
+IKILI_ISLEMCILER = frozenset(["==", "!=", "<=", ">=", "&&", "||", "<<", ">>", "++", "--"])
+
+
+def _kelime_karakteri_mi(karakter: str) -> bool:
+    """Düzenli ifadelerdeki \\w tanımına uygun karakter kontrolü"""
+    return karakter.isalnum() or karakter == "_"
+
+
+# Karakter sınıfı tablosuna göre dallanan, düzenli ifade kullanmayan leksikal çözümleyici
+class TabloLeksikalCozumleyici:
+    """SozdizimRenklendiricisi.kalip_listesi ile aynı çıktıyı üretir.
+    
+    Her konumda on kalıbı sırayla denemek yerine ilk karakterin sınıfına
+    bakılır ve yalnızca o sınıfa ait tarama yordamı çalıştırılır.
+    """
+    
+    def __init__(self, rezerve_sozcukler: List[str]):
+        self.rezerve_sozcukler = frozenset(rezerve_sozcukler)
+        self.tarayicilar = {
+            KarakterSinifi.BOSLUK: self._bosluk_tara,
+            KarakterSinifi.HARF: self._kelime_tara,
+            KarakterSinifi.RAKAM: self._sayi_tara,
+            KarakterSinifi.CIFT_TIRNAK: self._dizgi_tara,
+            KarakterSinifi.TEK_TIRNAK: self._tek_karakter_tara,
+            KarakterSinifi.BOLU: self._bolu_tara,
+            KarakterSinifi.DIYEZ: self._onislemci_tara,
+            KarakterSinifi.ISLEMCI: self._islemci_tara,
+            KarakterSinifi.AYRAC: self._ayrac_tara,
+        }
+        # Sınıf tablosunun tarama yordamlarına çözülmüş hali; döngüde Enum karması hesaplanmaz
+        self.tarama_tablosu = [self.tarayicilar.get(sinif) for sinif in KARAKTER_SINIFI_TABLOSU]
+    
+    def ayristir(self, kaynak_metin: str) -> List[LeksikolBirim]:
+        """Kaynak metni leksikal birimlere ayrıştırır"""
+        return self.parca_ayristir(kaynak_metin, 0, len(kaynak_metin))[0]
+    
+    def parca_ayristir(self, kaynak_metin: str, konum: int, bitis: int) -> Tuple[List[LeksikolBirim], int]:
+        """[konum, bitis) aralığında başlayan birimleri ayrıştırır.
+        
+        Birimler bitis sınırını aşabilir; dönen konum bir sonraki parçanın başlangıcıdır.
+        """
+        leksikal_birimler = []
+        tarama_tablosu = self.tarama_tablosu
+        uzunluk = min(bitis, len(kaynak_metin))
+        
+        while konum < uzunluk:
+            karakter = kaynak_metin[konum]
+            kod = ord(karakter)
+            if kod < 256:
+                tarayici = tarama_tablosu[kod]
+            else:
+                tarayici = self.tarayicilar.get(_karakter_sinifini_bul(karakter))
+            sonuc = tarayici(kaynak_metin, konum) if tarayici else None
+            
+            if sonuc is None:
+                konum += 1  # Tanınmayan sembolü geç
+                continue
+            
+            birim_sonu, kategori = sonuc
+            if kategori != LeksikolTip.BOSALAN:  # Beyaz boşlukları kaydetme
+                leksikal_birimler.append(LeksikolBirim(konum, birim_sonu, kategori, kaynak_metin[konum:birim_sonu]))
+            konum = birim_sonu
+        
+        return leksikal_birimler, konum
+    
+    @staticmethod
+    def _sinir_var_mi(metin: str, konum: int) -> bool:
+        """Konumdan önceki karakter kelime karakteri değilse sınır (\\b) vardır;
+        tüm çağıranlarda konumdaki karakter kelime karakteridir"""
+        return konum == 0 or not _kelime_karakteri_mi(metin[konum - 1])
+    
+    @staticmethod
+    def _bitis_siniri_var_mi(metin: str, bitis: int) -> bool:
+        """Son karakter kelime karakteriyken bitişte sınır olup olmadığını kontrol et"""
+        return bitis == len(metin) or not _kelime_karakteri_mi(metin[bitis])
+    
+    def _bosluk_tara(self, metin: str, konum: int):
+        bitis = konum + 1
+        uzunluk = len(metin)
+        while bitis < uzunluk and metin[bitis].isspace():
+            bitis += 1
+        return bitis, LeksikolTip.BOSALAN
+    
+    def _kelime_tara(self, metin: str, konum: int):
+        if not self._sinir_var_mi(metin, konum):
+            return None
+        bitis = konum + 1
+        uzunluk = len(metin)
+        while bitis < uzunluk and metin[bitis] in KIMLIK_KARAKTERLERI:
+            bitis += 1
+        # Ardından ASCII dışı bir kelime karakteri gelirse hiçbir kalıp eşleşmez
+        if not self._bitis_siniri_var_mi(metin, bitis):
+            return None
+        if metin[konum:bitis] in self.rezerve_sozcukler:
+            return bitis, LeksikolTip.REZERVE_KELIME
+        return bitis, LeksikolTip.DEGISKEN_ADI
+    
+    @staticmethod
+    def _rakamlari_gec(metin: str, konum: int) -> int:
+        uzunluk = len(metin)
+        while konum < uzunluk and metin[konum].isdecimal():
+            konum += 1
+        return konum
+    
+    def _us_sonu(self, metin: str, konum: int) -> Optional[int]:
+        """[eE][+-]?\\d+ kısmının bitişi; yoksa None"""
+        if konum >= len(metin) or metin[konum] not in "eE":
+            return None
+        konum += 1
+        if konum < len(metin) and metin[konum] in "+-":
+            konum += 1
+        if konum < len(metin) and metin[konum].isdecimal():
+            return self._rakamlari_gec(metin, konum)
+        return None
+    
+    def _sayi_tara(self, metin: str, konum: int):
+        if not self._sinir_var_mi(metin, konum):
+            return None
+        tam_sonu = self._rakamlari_gec(metin, konum)
+        
+        # Düzenli ifadenin geri izleme sırasıyla aday bitişler
+        adaylar = []
+        if tam_sonu + 1 < len(metin) and metin[tam_sonu] == "." and metin[tam_sonu + 1].isdecimal():
+            kesir_sonu = self._rakamlari_gec(metin, tam_sonu + 1)
+            us_sonu = self._us_sonu(metin, kesir_sonu)
+            if us_sonu is not None:
+                adaylar.append(us_sonu)
+            adaylar.append(kesir_sonu)
+        us_sonu = self._us_sonu(metin, tam_sonu)
+        if us_sonu is not None:
+            adaylar.append(us_sonu)
+        adaylar.append(tam_sonu)
+        
+        for bitis in adaylar:
+            if self._bitis_siniri_var_mi(metin, bitis):
+                return bitis, LeksikolTip.NUMERIK_DEGER
+        return None
+    
+    def _dizgi_tara(self, metin: str, konum: int):
+        bitis = konum + 1
+        uzunluk = len(metin)
+        while bitis < uzunluk:
+            karakter = metin[bitis]
+            if karakter == '"':
+                return bitis + 1, LeksikolTip.DIZGI
+            if karakter == "\\":
+                if bitis + 1 >= uzunluk or metin[bitis + 1] == "\n":
+                    return None
+                bitis += 2
+            else:
+                bitis += 1
+        return None
+    
+    def _tek_karakter_tara(self, metin: str, konum: int):
+        bitis = konum + 1
+        if bitis < len(metin) and metin[bitis] == "\\":
+            if bitis + 1 >= len(metin) or metin[bitis + 1] == "\n":
+                return None
+            bitis += 2
+        elif bitis < len(metin) and metin[bitis] != "'":
+            bitis += 1
+        else:
+            return None
+        if bitis < len(metin) and metin[bitis] == "'":
+            return bitis + 1, LeksikolTip.TEK_KARAKTER
+        return None
+    
+    def _bolu_tara(self, metin: str, konum: int):
+        sonraki = metin[konum + 1:konum + 2]
+        if sonraki == "/":
+            bitis = metin.find("\n", konum)
+            return (bitis if bitis != -1 else len(metin)), LeksikolTip.ACIKLAMA
+        if sonraki == "*":
+            bitis = metin.find("*/", konum + 2)
+            if bitis != -1:
+                return bitis + 2, LeksikolTip.ACIKLAMA
+        # Kapanmamış açıklama veya tek '/' işlemci olarak değerlendirilir
+        return self._islemci_tara(metin, konum)
+    
+    def _onislemci_tara(self, metin: str, konum: int):
+        bitis = konum + 1
+        uzunluk = len(metin)
+        while bitis < uzunluk and metin[bitis].isspace():
+            bitis += 1
+        if bitis >= uzunluk or not _kelime_karakteri_mi(metin[bitis]):
+            return None
+        bitis = metin.find("\n", bitis)
+        return (bitis if bitis != -1 else uzunluk), LeksikolTip.ONISLEMCI_KOMUT
+    
+    def _islemci_tara(self, metin: str, konum: int):
+        if metin[konum:konum + 2] in IKILI_ISLEMCILER:
+            return konum + 2, LeksikolTip.ISLEMCI
+        return konum + 1, LeksikolTip.ISLEMCI
+    
+    def _ayrac_tara(self, metin: str, konum: int):
+        return konum + 1, LeksikolTip.AYRAC
+
+
 # Sözdizimi renklendirme işlemlerini yürüten merkezi sınıf
 class SozdizimRenklendiricisi:
     def __init__(self, text_widget):
@@ -58,6 +353,10 @@ class SozdizimRenklendiricisi:
             (LeksikolTip.BOSALAN, r'\s+'),
         ]
         
+        # Çalışma anında seçilebilen leksikal çözümleme yöntemi
+        self.leksikal_yontem = "duzenli_ifade"
+        self.tablo_cozumleyici = TabloLeksikalCozumleyici(self.rezerveSozcukler)
+        
         # Leksikal kategoriler için görsel stil tanımlamaları
         self.stil_haritasi = {
             LeksikolTip.REZERVE_KELIME: {"foreground": "blue", "font": ("Courier", 12, "bold")},
@@ -72,8 +371,9 @@ class SozdizimRenklendiricisi:
             LeksikolTip.BOSALAN: {"foreground": "black", "font": ("Courier", 12, "normal")}
         }
         
-        # Stilendirme etiketlerini hazırla
-        self._etiketleri_hazirla()
+        # Stilendirme etiketlerini hazırla (widget olmadan yalnızca çözümleme yapılabilir)
+        if self.text_widget is not None:
+            self._etiketleri_hazirla()
     
     def _etiketleri_hazirla(self):
         """Metin widget'ı için görsel etiketleri yapılandırır"""
@@ -83,11 +383,24 @@ class SozdizimRenklendiricisi:
     
     def leksikal_analiz_yap(self):
         """Kaynak metni leksikal birimlere ayrıştırır"""
-        self.leksikal_birimler.clear()
-        kaynak_metin = self.text_widget.get("1.0", tk.END)
+        return self.metni_ayristir(self.text_widget.get("1.0", tk.END))
+    
+    def metni_ayristir(self, kaynak_metin: str):
+        """Verilen metni seçili yöntemle leksikal birimlere ayrıştırır"""
+        self.leksikal_birimler[:] = self.parca_ayristir(kaynak_metin, 0, len(kaynak_metin))[0]
+        return self.leksikal_birimler
+    
+    def parca_ayristir(self, kaynak_metin: str, konum: int, bitis: int) -> Tuple[List[LeksikolBirim], int]:
+        """[konum, bitis) aralığında başlayan birimleri seçili yöntemle ayrıştırır"""
+        if self.leksikal_yontem == "tablo":
+            return self.tablo_cozumleyici.parca_ayristir(kaynak_metin, konum, bitis)
+        return self._duzenli_ifade_ile_ayristir(kaynak_metin, konum, bitis)
+    
+    def _duzenli_ifade_ile_ayristir(self, kaynak_metin: str, konum: int, bitis: int):
+        """Kalıp listesini sırayla deneyerek ayrıştırır"""
+        leksikal_birimler = []
         
-        konum = 0
-        while konum < len(kaynak_metin):
+        while konum < min(bitis, len(kaynak_metin)):
             eslesti = False
             
             for kategori, kalip in self.kalip_listesi:
@@ -103,7 +416,7 @@ class SozdizimRenklendiricisi:
                     )
                     
                     if kategori != LeksikolTip.BOSALAN:  # Beyaz boşlukları kaydetme
-                        self.leksikal_birimler.append(leksikal_birim)
+                        leksikal_birimler.append(leksikal_birim)
                     
                     konum = eslesme.end()
                     eslesti = True
@@ -112,14 +425,32 @@ class SozdizimRenklendiricisi:
             if not eslesti:
                 konum += 1  # Tanınmayan sembolü geç
         
-        return self.leksikal_birimler
+        return leksikal_birimler, konum
+    
+    def etiketleri_temizle(self, baslangic: str = "1.0", bitis: str = tk.END):
+        """Verilen aralıktaki tüm renklendirme etiketlerini kaldırır"""
+        for kategori in LeksikolTip:
+            etiket_adi = f"leksikal_{kategori.name.lower()}"
+            self.text_widget.tag_remove(etiket_adi, baslangic, bitis)
+    
+    def araligi_renklendir(self, birimler: List[LeksikolBirim], cevirici: 'SatirSutunCevirici',
+                           baslangic: int, bitis: int):
+        """[baslangic, bitis) aralığını yeniden renklendirir; etiketler kategori başına tek çağrıyla eklenir"""
+        baslangic_indeksi = cevirici.indeks(baslangic)
+        araliklar: Dict[LeksikolTip, List[str]] = {}
+        for birim in birimler:
+            araliklar.setdefault(birim.kategori, []).extend(
+                (cevirici.indeks(birim.baslama_indeks), cevirici.indeks(birim.bitis_indeks)))
+        bitis_indeksi = cevirici.indeks(bitis)  # Son birimin bitişinden önce olamaz
+        
+        self.etiketleri_temizle(baslangic_indeksi, bitis_indeksi)
+        for kategori, indeksler in araliklar.items():
+            self.text_widget.tag_add(f"leksikal_{kategori.name.lower()}", *indeksler)
     
     def renklendirmeyi_uygula(self):
         """Tespit edilen leksikal birimlere göre metni görsel olarak biçimlendirir"""
         # Öncelikle tüm etiketleri kaldır
-        for kategori in LeksikolTip:
-            etiket_adi = f"leksikal_{kategori.name.lower()}"
-            self.text_widget.tag_remove(etiket_adi, "1.0", tk.END)
+        self.etiketleri_temizle()
         
         # Leksikal birimleri renklendir
         for birim in self.leksikal_birimler:
@@ -129,12 +460,193 @@ class SozdizimRenklendiricisi:
             self.text_widget.tag_add(etiket_adi, baslama_konumu, bitis_konumu)
 
 
+# Artan karakter konumlarını Tk "satır.sütun" indekslerine çeviren yardımcı sınıf
+class SatirSutunCevirici:
+    """Tk, "1.0+Nc" biçimindeki indeksleri her seferinde baştan sayar ve bu
+    büyük metinlerde yavaştır; bu sınıf satır sayısını konumlar ilerledikçe tutar."""
+    
+    def __init__(self, kaynak_metin: str):
+        self.kaynak_metin = kaynak_metin
+        self.satir = 1
+        self.satir_basi = 0
+        self.onceki_konum = 0
+    
+    def indeks(self, konum: int) -> str:
+        """Konumu indekse çevirir; konumlar azalmayan sırada verilmelidir"""
+        yeni_satirlar = self.kaynak_metin.count("\n", self.onceki_konum, konum)
+        if yeni_satirlar:
+            self.satir += yeni_satirlar
+            self.satir_basi = self.kaynak_metin.rfind("\n", self.onceki_konum, konum) + 1
+        self.onceki_konum = konum
+        return f"{self.satir}.{konum - self.satir_basi}"
+
+
+def ilk_fark_konumu(eski_metin: str, yeni_metin: str, blok_boyutu: int = 64 * 1024) -> int:
+    """İki metnin ilk farklı karakterinin konumu; ortak kısım bloklar halinde karşılaştırılır"""
+    uzunluk = min(len(eski_metin), len(yeni_metin))
+    konum = 0
+    while konum < uzunluk and eski_metin[konum:konum + blok_boyutu] == yeni_metin[konum:konum + blok_boyutu]:
+        konum += blok_boyutu
+    while konum < uzunluk and eski_metin[konum] == yeni_metin[konum]:
+        konum += 1
+    return min(konum, uzunluk)
+
+
+# Büyük metinleri kısa adımlarla çözümleyip renklendiren sınıf
+class ArtimliLeksikalAnaliz:
+    """Önceki bir analiz verilirse, düzenlenen bölgeden önce biten birimler
+    yeniden kullanılır ve çözümleme metnin başından değil o bölgeden başlar.
+    
+    Kapanmamış bir dizgi veya açıklamanın sonucu metnin sonuna kadar ileriye
+    bakılarak belirlendiğinden, birimler ilk böyle konumdan öteye devralınmaz.
+    """
+    
+    # Satır sonunu aşabilen tek sınırlı ileri bakış: kapanmayan tek tırnak (en fazla 3 karakter)
+    ILERI_BAKIS_PAYI = 3
+    
+    def __init__(self, renklendirici: SozdizimRenklendiricisi, kaynak_metin: str,
+                 onceki: Optional['ArtimliLeksikalAnaliz'] = None,
+                 parca_boyutu: int = ANALIZ_PARCA_BOYUTU):
+        self.renklendirici = renklendirici
+        self.kaynak_metin = kaynak_metin
+        self.leksikal_yontem = renklendirici.leksikal_yontem
+        self.parca_boyutu = parca_boyutu
+        self.konum = 0
+        self.leksikal_birimler: List[LeksikolBirim] = []
+        self.acik_kalan_konum = None  # Sonucu metin sonuna kadar bakılarak belirlenen ilk konum
+        if onceki is not None and onceki.leksikal_yontem == self.leksikal_yontem:
+            self._oncekinden_devral(onceki)
+        self.cevirici = SatirSutunCevirici(kaynak_metin)
+    
+    def _oncekinden_devral(self, onceki: 'ArtimliLeksikalAnaliz'):
+        """Düzenlemeden etkilenmeyen birimleri önceki analizden alır"""
+        # Sayı, kelime ve açıklama kalıplarının ileri bakışı satır sonunda durur;
+        # bu yüzden düzenlenen satırın başından önce biten birimler güvenlidir
+        fark = ilk_fark_konumu(onceki.kaynak_metin, self.kaynak_metin)
+        satir_basi = self.kaynak_metin.rfind("\n", 0, fark) + 1
+        sinir = min(satir_basi - self.ILERI_BAKIS_PAYI, onceki.konum)
+        if onceki.acik_kalan_konum is not None:
+            sinir = min(sinir, onceki.acik_kalan_konum)
+        
+        # Bitişi sınırı geçmeyen son birimi ikili arama ile bul
+        birimler = onceki.leksikal_birimler
+        alt, ust = 0, len(birimler)
+        while alt < ust:
+            orta = (alt + ust) // 2
+            if birimler[orta].bitis_indeks <= sinir:
+                alt = orta + 1
+            else:
+                ust = orta
+        
+        self.leksikal_birimler = birimler[:alt]
+        self.konum = birimler[alt - 1].bitis_indeks if alt else 0
+    
+    def tamamlandi_mi(self) -> bool:
+        return self.konum >= len(self.kaynak_metin)
+    
+    def ilerleme(self) -> float:
+        """Tamamlanan oran (0-1)"""
+        return self.konum / len(self.kaynak_metin) if self.kaynak_metin else 1.0
+    
+    def adim_at(self):
+        """Bir sonraki parçayı çözümler ve renklendirir"""
+        baslangic = self.konum
+        birimler, self.konum = self.renklendirici.parca_ayristir(
+            self.kaynak_metin, baslangic, baslangic + self.parca_boyutu)
+        self.leksikal_birimler.extend(birimler)
+        if self.acik_kalan_konum is None:
+            self.acik_kalan_konum = self._acik_kalan_ara(birimler, baslangic, self.konum)
+        self.renklendirici.araligi_renklendir(birimler, self.cevirici, baslangic, self.konum)
+    
+    def _acik_kalan_ara(self, birimler: List[LeksikolBirim], baslangic: int, bitis: int) -> Optional[int]:
+        """Aralıktaki ilk kapanmamış '"', '#' veya '/*' konumunu arar.
+        
+        Bunlar eşleşmediğinde atlanır (ya da '/' işlemci olur); bu karar
+        sonraki metnin tamamına bağlıdır.
+        """
+        metin = self.kaynak_metin
+        onceki_bitis = baslangic
+        for birim in birimler:
+            if birim.baslama_indeks > onceki_bitis:
+                konum = self._atlananlarda_ara(onceki_bitis, birim.baslama_indeks)
+                if konum is not None:
+                    return konum
+            if birim.icerik == "/" and metin.startswith("*", birim.bitis_indeks):
+                return birim.baslama_indeks
+            onceki_bitis = birim.bitis_indeks
+        if bitis > onceki_bitis:
+            return self._atlananlarda_ara(onceki_bitis, bitis)
+        return None
+    
+    def _atlananlarda_ara(self, baslangic: int, bitis: int) -> Optional[int]:
+        """Birimler arasında kalan (boşluk veya atlanan) metinde '"' ya da '#' arar"""
+        adaylar = [k for k in (self.kaynak_metin.find('"', baslangic, bitis),
+                               self.kaynak_metin.find("#", baslangic, bitis)) if k != -1]
+        return min(adaylar) if adaylar else None
+
+
+# Dosyayı mmap üzerinden parça parça okuyup çözen sınıf
+class ParcaliDosyaOkuyucu:
+    def __init__(self, dosya_yolu: str, parca_boyutu: int = DOSYA_PARCA_BOYUTU, kodlama: str = "utf-8"):
+        self.parca_boyutu = parca_boyutu
+        self.dosya = open(dosya_yolu, "rb")
+        try:
+            self.boyut = os.fstat(self.dosya.fileno()).st_size
+            # Boş dosyalar eşlenemez
+            self.bellek = mmap.mmap(self.dosya.fileno(), 0, access=mmap.ACCESS_READ) if self.boyut else None
+        except (OSError, ValueError):
+            self.dosya.close()
+            raise
+        self.konum = 0
+        self.cozucu = codecs.getincrementaldecoder(kodlama)(errors="strict")
+        self.kodlama_hatasi = False  # Geçersiz baytlar U+FFFD ile değiştirildi mi?
+        self.satir_sonu = None       # Dosyada ilk görülen satır sonu ("\n", "\r\n" veya "\r")
+        self._bekleyen = ""  # Parça sonunda kalan, "\n" ile devam edebilecek "\r"
+    
+    def bitti_mi(self) -> bool:
+        return self.konum >= self.boyut
+    
+    def ilerleme(self) -> float:
+        """Okunan oran (0-1)"""
+        return self.konum / self.boyut if self.boyut else 1.0
+    
+    def sonraki_parca(self) -> str:
+        """Bir sonraki parçayı satır sonları "\n" olacak şekilde çözüp döndürür"""
+        veri = self.bellek[self.konum:self.konum + self.parca_boyutu] if self.bellek else b""
+        self.konum += len(veri)
+        try:
+            cozulen = self.cozucu.decode(veri, final=self.bitti_mi())
+        except UnicodeDecodeError:
+            # Hatalı çağrı çözücünün tamponunu değiştirmez; aynı veri değiştirme kipinde yeniden çözülür
+            self.kodlama_hatasi = True
+            self.cozucu.errors = "replace"
+            cozulen = self.cozucu.decode(veri, final=self.bitti_mi())
+        
+        parca = self._bekleyen + cozulen
+        self._bekleyen = ""
+        if parca.endswith("\r") and not self.bitti_mi():
+            self._bekleyen = "\r"
+            parca = parca[:-1]
+        if self.satir_sonu is None:
+            ilk_satir_sonu = re.search(r"\r\n|\r|\n", parca)
+            if ilk_satir_sonu:
+                self.satir_sonu = ilk_satir_sonu.group()
+        return parca.replace("\r\n", "\n").replace("\r", "\n")
+    
+    def kapat(self):
+        if self.bellek is not None:
+            self.bellek.close()
+        self.dosya.close()
+
+
 # Leksikal çözümleme sonuçlarını görselleştiren pencere sınıfı
 class LeksikolAnalizGorunumu(tk.Toplevel):
+    BASLIK = "Leksikal Çözümleme"
+    
     def __init__(self, parent, renklendirici):
         super().__init__(parent)
         self.renklendirici = renklendirici
-        self.title("Leksikal Çözümleme")
+        self.title(self.BASLIK)
         self.geometry("500x600")
         
         # Hiyerarşik görüntüleyici oluştur
@@ -159,15 +671,22 @@ class LeksikolAnalizGorunumu(tk.Toplevel):
         for ogesi in self.agac_gorunumu.get_children():
             self.agac_gorunumu.delete(ogesi)
         
+        self.title(self.BASLIK)
+        
         # Ana düğümü ekle
         kok_dugum = self.agac_gorunumu.insert("", "end", text="C Programlama Dili Kaynak Kodu", open=True)
         
-        # Her leksikal birimi ağaca ekle
-        for sira, birim in enumerate(self.renklendirici.leksikal_birimler):
+        # Her leksikal birimi ağaca ekle; büyük metinlerde Treeview'i kilitlememek için sınır uygulanır
+        birimler = self.renklendirici.leksikal_birimler
+        for sira, birim in enumerate(birimler[:GORUNUM_BIRIM_SINIRI]):
             kategori_ismi = self.leksikolKategoriIsminiAl(birim.kategori)
             birim_metni = repr(birim.icerik)
             self.agac_gorunumu.insert(kok_dugum, "end", text=f"Birim {sira+1}", 
                            values=(kategori_ismi, birim_metni))
+        
+        if len(birimler) > GORUNUM_BIRIM_SINIRI:
+            self.agac_gorunumu.insert(kok_dugum, "end", text="...",
+                           values=("", f"{len(birimler) - GORUNUM_BIRIM_SINIRI} birim daha gösterilmiyor"))
     
     @staticmethod
     def leksikolKategoriIsminiAl(kategori):
@@ -221,6 +740,120 @@ class SozdizimDugumu:
             self.alt_dugumler = []
 
 
+# Düğümleri paralel dizilerde saklayan düz (arena) sözdizimi ağacı
+class DuzSozdizimAgaci:
+    """Her düğüm bir tamsayı kimliktir; alanlar paralel dizilerde tutulur.
+    
+    Düğüm başına yalnızca kategori, ebeveyn, ilk çocuk, sonraki kardeş ve
+    leksikal birim aralığı saklanır. Görüntü metni (deger) düğüm
+    gösterilene kadar oluşturulmaz.
+    """
+    
+    BOS = -1  # Olmayan düğüm / birim işareti
+    
+    def __init__(self, leksikal_birimler: List[LeksikolBirim]):
+        # deger ağaç kurulduktan çok sonra (düğüm gösterilince) okunur; sonraki
+        # çözümlemeler listeyi yerinde değiştirse de ağaç kendi kopyasına bakar
+        self.leksikal_birimler = list(leksikal_birimler)
+        self.kategoriler = array('B')      # DugumKategorisi sıra numarası
+        self.bicimler = array('H')         # Görüntü biçimi kimliği
+        self.ebeveynler = array('i')
+        self.ilk_cocuklar = array('i')
+        self.son_cocuklar = array('i')     # Sona O(1) ekleme için
+        self.sonraki_kardesler = array('i')
+        self.birim_baslangiclari = array('i')
+        self.birim_bitisleri = array('i')
+        
+        # Biçim metinleri bir kez saklanır, düğümler kimlikle başvurur
+        self.bicim_listesi: List[str] = []
+        self._bicim_kimlikleri: Dict[str, int] = {}
+    
+    def __len__(self):
+        return len(self.kategoriler)
+    
+    def dugum_ekle(self, kategori: DugumKategorisi, bicim: str = "",
+                   baslangic: int = BOS, bitis: int = BOS) -> int:
+        """Yeni bir düğüm oluşturur ve kimliğini döndürür"""
+        bicim_kimligi = self._bicim_kimlikleri.get(bicim)
+        if bicim_kimligi is None:
+            bicim_kimligi = len(self.bicim_listesi)
+            self._bicim_kimlikleri[bicim] = bicim_kimligi
+            self.bicim_listesi.append(bicim)
+        
+        self.kategoriler.append(_DUGUM_KATEGORI_SIRASI[kategori])
+        self.bicimler.append(bicim_kimligi)
+        self.ebeveynler.append(self.BOS)
+        self.ilk_cocuklar.append(self.BOS)
+        self.son_cocuklar.append(self.BOS)
+        self.sonraki_kardesler.append(self.BOS)
+        self.birim_baslangiclari.append(baslangic)
+        self.birim_bitisleri.append(bitis)
+        return len(self.kategoriler) - 1
+    
+    def alt_dugum_ekle(self, ebeveyn: int, cocuk: int):
+        """Çocuk düğümü ebeveynin çocuk listesinin sonuna bağlar"""
+        self.ebeveynler[cocuk] = ebeveyn
+        son = self.son_cocuklar[ebeveyn]
+        if son == self.BOS:
+            self.ilk_cocuklar[ebeveyn] = cocuk
+        else:
+            self.sonraki_kardesler[son] = cocuk
+        self.son_cocuklar[ebeveyn] = cocuk
+    
+    def kategori(self, dugum: int) -> DugumKategorisi:
+        return _DUGUM_KATEGORILERI[self.kategoriler[dugum]]
+    
+    def deger(self, dugum: int) -> str:
+        """Düğümün görüntü metnini ihtiyaç anında oluşturur"""
+        baslangic = self.birim_baslangiclari[dugum]
+        icerikler = []
+        if baslangic != self.BOS:
+            icerikler = [b.icerik for b in self.leksikal_birimler[baslangic:self.birim_bitisleri[dugum]]]
+        return self.bicim_listesi[self.bicimler[dugum]].format(*icerikler)
+    
+    def alt_dugumler(self, dugum: int) -> List[int]:
+        """Düğümün çocuklarını sırasıyla döndürür"""
+        cocuklar = []
+        cocuk = self.ilk_cocuklar[dugum]
+        while cocuk != self.BOS:
+            cocuklar.append(cocuk)
+            cocuk = self.sonraki_kardesler[cocuk]
+        return cocuklar
+    
+    def kok(self) -> 'DuzSozdizimDugumu':
+        """Kök düğümü SozdizimDugumu arayüzüyle döndürür"""
+        return DuzSozdizimDugumu(self, 0)
+
+
+# Düz ağaçtaki bir düğümü SozdizimDugumu arayüzüyle sunan adaptör
+class DuzSozdizimDugumu:
+    __slots__ = ("agac", "kimlik")
+    
+    def __init__(self, agac: DuzSozdizimAgaci, kimlik: int):
+        self.agac = agac
+        self.kimlik = kimlik
+    
+    @property
+    def kategori(self) -> DugumKategorisi:
+        return self.agac.kategori(self.kimlik)
+    
+    @property
+    def deger(self) -> str:
+        return self.agac.deger(self.kimlik)
+    
+    @property
+    def alt_dugumler(self) -> List['DuzSozdizimDugumu']:
+        return [DuzSozdizimDugumu(self.agac, c) for c in self.agac.alt_dugumler(self.kimlik)]
+
+
+# Çözümleyicinin dil bilgisi metotlarında dolaşan düğüm tutamacı:
+# SozdizimCozumleyicisi için SozdizimDugumu, DuzSozdizimCozumleyicisi için arena kimliği (int)
+DugumTutamaci = Union[SozdizimDugumu, int]
+
+_DUGUM_KATEGORILERI = list(DugumKategorisi)
+_DUGUM_KATEGORI_SIRASI = {k: i for i, k in enumerate(_DUGUM_KATEGORILERI)}
+
+
 # Gelişmiş sözdizimsel çözümleyici sınıfı
 class SozdizimCozumleyicisi:
     def __init__(self, leksikal_birimler: List[LeksikolBirim]):
@@ -237,6 +870,24 @@ class SozdizimCozumleyicisi:
         else:
             self.aktif_birim = None
     
+    def _aktif_indeks(self) -> int:
+        """Aktif leksikal birimin listedeki sırası"""
+        return self.mevcut_konum - 1
+    
+    def _dugum_olustur(self, kategori: DugumKategorisi, bicim: str = "",
+                       baslangic: int = -1, bitis: int = -1) -> DugumTutamaci:
+        """Düğüm oluşturur; bicim, [baslangic, bitis) birimlerinin içerikleriyle doldurulur"""
+        icerikler = [b.icerik for b in self.leksikal_birimler[baslangic:bitis]] if baslangic >= 0 else []
+        return SozdizimDugumu(kategori, bicim.format(*icerikler))
+    
+    def _alt_ekle(self, ebeveyn: DugumTutamaci, cocuk: DugumTutamaci):
+        """Çocuk düğümü ebeveyne ekler"""
+        ebeveyn.alt_dugumler.append(cocuk)
+    
+    def _alt_var_mi(self, dugum: DugumTutamaci) -> bool:
+        """Düğümün en az bir çocuğu olup olmadığını kontrol et"""
+        return bool(dugum.alt_dugumler)
+    
     def _eslesme_kontrol(self, beklenen_deger: str = None, beklenen_kategori: LeksikolTip = None) -> bool:
         """Leksikal birimin beklenenden eşleşip eşleşmediğini kontrol et"""
         if self.aktif_birim is None:
@@ -247,29 +898,31 @@ class SozdizimCozumleyicisi:
             return False
         return True
     
-    def cozumle(self) -> SozdizimDugumu:
+    def cozumle(self) -> DugumTutamaci:
         """Ana çözümleme metodu"""
-        kok = SozdizimDugumu(DugumKategorisi.PROGRAM_KOKÜ, "Program")
+        kok = self._dugum_olustur(DugumKategorisi.PROGRAM_KOKÜ, "Program")
         
         while self.aktif_birim is not None:
             if self.aktif_birim.kategori == LeksikolTip.ACIKLAMA:
-                yorum_dugumu = SozdizimDugumu(DugumKategorisi.IFADE_BILDIRIMI, f"Yorum: {self.aktif_birim.icerik[:30]}...")
-                kok.alt_dugumler.append(yorum_dugumu)
+                indeks = self._aktif_indeks()
+                yorum_dugumu = self._dugum_olustur(DugumKategorisi.IFADE_BILDIRIMI, "Yorum: {0:.30}...", indeks, indeks + 1)
+                self._alt_ekle(kok, yorum_dugumu)
                 self._ilerlet()
             elif self.aktif_birim.kategori == LeksikolTip.ONISLEMCI_KOMUT:
-                onislemci_dugumu = SozdizimDugumu(DugumKategorisi.IFADE_BILDIRIMI, f"Ön İşlemci: {self.aktif_birim.icerik}")
-                kok.alt_dugumler.append(onislemci_dugumu)
+                indeks = self._aktif_indeks()
+                onislemci_dugumu = self._dugum_olustur(DugumKategorisi.IFADE_BILDIRIMI, "Ön İşlemci: {0}", indeks, indeks + 1)
+                self._alt_ekle(kok, onislemci_dugumu)
                 self._ilerlet()
             else:
                 ifade = self._ifade_cozumle()
-                if ifade:
-                    kok.alt_dugumler.append(ifade)
+                if ifade is not None:
+                    self._alt_ekle(kok, ifade)
                 else:
                     self._ilerlet()
         
         return kok
     
-    def _ifade_cozumle(self) -> Optional[SozdizimDugumu]:
+    def _ifade_cozumle(self) -> Optional[DugumTutamaci]:
         """İfadeleri çözümler"""
         if self.aktif_birim is None:
             return None
@@ -287,50 +940,51 @@ class SozdizimCozumleyicisi:
         # Basit ifade olarak çözümle
         return self._basit_ifade_cozumle()
     
-    def _degisken_veya_fonksiyon_cozumle(self) -> SozdizimDugumu:
+    def _degisken_veya_fonksiyon_cozumle(self) -> DugumTutamaci:
         """Değişken veya fonksiyon tanımı çözümler"""
-        tip_birimi = self.aktif_birim
+        tip_indeksi = self._aktif_indeks()
         self._ilerlet()
         
         if self.aktif_birim and self.aktif_birim.kategori == LeksikolTip.DEGISKEN_ADI:
-            isim_birimi = self.aktif_birim
+            isim_indeksi = self._aktif_indeks()
             self._ilerlet()
             
             # Fonksiyon mu değişken mi?
             if self._eslesme_kontrol("(", LeksikolTip.AYRAC):
-                return self._fonksiyon_tanimi_cozumle(tip_birimi, isim_birimi)
+                return self._fonksiyon_tanimi_cozumle(tip_indeksi, isim_indeksi)
             else:
-                return self._degisken_bildirimi_cozumle(tip_birimi, isim_birimi)
+                return self._degisken_bildirimi_cozumle(tip_indeksi, isim_indeksi)
         
-        return SozdizimDugumu(DugumKategorisi.IFADE_BILDIRIMI, "Geçersiz")
+        return self._dugum_olustur(DugumKategorisi.IFADE_BILDIRIMI, "Geçersiz")
     
-    def _fonksiyon_tanimi_cozumle(self, tip_birimi: LeksikolBirim, isim_birimi: LeksikolBirim) -> SozdizimDugumu:
+    def _fonksiyon_tanimi_cozumle(self, tip_indeksi: int, isim_indeksi: int) -> DugumTutamaci:
         """Fonksiyon tanımı çözümler"""
-        fonk_dugumu = SozdizimDugumu(DugumKategorisi.FONKSIYON_TANIMI, f"Fonksiyon: {isim_birimi.icerik}")
+        fonk_dugumu = self._dugum_olustur(DugumKategorisi.FONKSIYON_TANIMI, "Fonksiyon: {0}", isim_indeksi, isim_indeksi + 1)
         
         # Return type
-        tip_dugumu = SozdizimDugumu(DugumKategorisi.VERİ_TIPI, tip_birimi.icerik)
-        fonk_dugumu.alt_dugumler.append(tip_dugumu)
+        tip_dugumu = self._dugum_olustur(DugumKategorisi.VERİ_TIPI, "{0}", tip_indeksi, tip_indeksi + 1)
+        self._alt_ekle(fonk_dugumu, tip_dugumu)
         
         # Function name
-        isim_dugumu = SozdizimDugumu(DugumKategorisi.KIMLIK_BELIRTECI, isim_birimi.icerik)
-        fonk_dugumu.alt_dugumler.append(isim_dugumu)
+        isim_dugumu = self._dugum_olustur(DugumKategorisi.KIMLIK_BELIRTECI, "{0}", isim_indeksi, isim_indeksi + 1)
+        self._alt_ekle(fonk_dugumu, isim_dugumu)
         
         # Parametreler
         if self._eslesme_kontrol("(", LeksikolTip.AYRAC):
             self._ilerlet()  # '(' atla
-            param_listesi = SozdizimDugumu(DugumKategorisi.PARAMETRE_LISTESI, "Parametreler")
+            param_listesi = self._dugum_olustur(DugumKategorisi.PARAMETRE_LISTESI, "Parametreler")
             
             # Basit parametre çözümlemesi
             while self.aktif_birim and not self._eslesme_kontrol(")", LeksikolTip.AYRAC):
                 if self.aktif_birim.kategori == LeksikolTip.REZERVE_KELIME:
-                    param_tip = self.aktif_birim.icerik
+                    param_tip_indeksi = self._aktif_indeks()
                     self._ilerlet()
                     if self.aktif_birim and self.aktif_birim.kategori == LeksikolTip.DEGISKEN_ADI:
-                        param_isim = self.aktif_birim.icerik
+                        # Tip ve isim ardışık birimlerdir: [tip, isim]
+                        param_dugumu = self._dugum_olustur(DugumKategorisi.PARAMETRE, "{0} {1}",
+                                                           param_tip_indeksi, param_tip_indeksi + 2)
                         self._ilerlet()
-                        param_dugumu = SozdizimDugumu(DugumKategorisi.PARAMETRE, f"{param_tip} {param_isim}")
-                        param_listesi.alt_dugumler.append(param_dugumu)
+                        self._alt_ekle(param_listesi, param_dugumu)
                 else:
                     self._ilerlet()
                 
@@ -340,27 +994,27 @@ class SozdizimCozumleyicisi:
             if self._eslesme_kontrol(")", LeksikolTip.AYRAC):
                 self._ilerlet()
             
-            fonk_dugumu.alt_dugumler.append(param_listesi)
+            self._alt_ekle(fonk_dugumu, param_listesi)
         
         # Function body
         if self._eslesme_kontrol("{", LeksikolTip.AYRAC):
             govde = self._kod_blogu_cozumle()
-            if govde:
-                fonk_dugumu.alt_dugumler.append(govde)
+            if govde is not None:
+                self._alt_ekle(fonk_dugumu, govde)
         
         return fonk_dugumu
     
-    def _degisken_bildirimi_cozumle(self, tip_birimi: LeksikolBirim, isim_birimi: LeksikolBirim) -> SozdizimDugumu:
+    def _degisken_bildirimi_cozumle(self, tip_indeksi: int, isim_indeksi: int) -> DugumTutamaci:
         """Değişken bildirimi çözümler"""
-        dugum = SozdizimDugumu(DugumKategorisi.DEGISKEN_BILDIRGESI, f"Değişken: {isim_birimi.icerik}")
+        dugum = self._dugum_olustur(DugumKategorisi.DEGISKEN_BILDIRGESI, "Değişken: {0}", isim_indeksi, isim_indeksi + 1)
         
         # Type
-        tip_dugumu = SozdizimDugumu(DugumKategorisi.VERİ_TIPI, tip_birimi.icerik)
-        dugum.alt_dugumler.append(tip_dugumu)
+        tip_dugumu = self._dugum_olustur(DugumKategorisi.VERİ_TIPI, "{0}", tip_indeksi, tip_indeksi + 1)
+        self._alt_ekle(dugum, tip_dugumu)
         
         # Name
-        isim_dugumu = SozdizimDugumu(DugumKategorisi.KIMLIK_BELIRTECI, isim_birimi.icerik)
-        dugum.alt_dugumler.append(isim_dugumu)
+        isim_dugumu = self._dugum_olustur(DugumKategorisi.KIMLIK_BELIRTECI, "{0}", isim_indeksi, isim_indeksi + 1)
+        self._alt_ekle(dugum, isim_dugumu)
         
         # Array veya assignment
         if self._eslesme_kontrol("[", LeksikolTip.AYRAC):
@@ -369,28 +1023,28 @@ class SozdizimCozumleyicisi:
         elif self._eslesme_kontrol("=", LeksikolTip.ISLEMCI):
             self._ilerlet()
             deger = self._ifade_degeri_cozumle()
-            if deger:
-                atama_dugumu = SozdizimDugumu(DugumKategorisi.ATAMA_ISLEMI, "Atama")
-                atama_dugumu.alt_dugumler.append(deger)
-                dugum.alt_dugumler.append(atama_dugumu)
+            if deger is not None:
+                atama_dugumu = self._dugum_olustur(DugumKategorisi.ATAMA_ISLEMI, "Atama")
+                self._alt_ekle(atama_dugumu, deger)
+                self._alt_ekle(dugum, atama_dugumu)
             self._noktalıvirgule_kadar_atla()
         else:
             self._noktalıvirgule_kadar_atla()
         
         return dugum
     
-    def _kod_blogu_cozumle(self) -> SozdizimDugumu:
+    def _kod_blogu_cozumle(self) -> Optional[DugumTutamaci]:
         """Kod bloğu çözümler"""
         if not self._eslesme_kontrol("{", LeksikolTip.AYRAC):
             return None
         
         self._ilerlet()  # '{' atla
-        blok = SozdizimDugumu(DugumKategorisi.KOD_BLOGU, "Kod Bloğu")
+        blok = self._dugum_olustur(DugumKategorisi.KOD_BLOGU, "Kod Bloğu")
         
         while self.aktif_birim and not self._eslesme_kontrol("}", LeksikolTip.AYRAC):
             ifade = self._ifade_cozumle()
-            if ifade:
-                blok.alt_dugumler.append(ifade)
+            if ifade is not None:
+                self._alt_ekle(blok, ifade)
             else:
                 self._ilerlet()
         
@@ -399,41 +1053,42 @@ class SozdizimCozumleyicisi:
         
         return blok
     
-    def _if_cozumle(self) -> SozdizimDugumu:
+    def _if_cozumle(self) -> DugumTutamaci:
         """If ifadesi çözümler"""
-        dugum = SozdizimDugumu(DugumKategorisi.KOSULLU_IFADE, "If İfadesi")
+        dugum = self._dugum_olustur(DugumKategorisi.KOSULLU_IFADE, "If İfadesi")
         self._ilerlet()  # 'if' atla
         
         if self._eslesme_kontrol("(", LeksikolTip.AYRAC):
             self._ilerlet()
-            kosul = SozdizimDugumu(DugumKategorisi.MATEMATIK_IFADE, "Koşul")
+            kosul = self._dugum_olustur(DugumKategorisi.MATEMATIK_IFADE, "Koşul")
             # Basit koşul çözümlemesi
             while self.aktif_birim and not self._eslesme_kontrol(")", LeksikolTip.AYRAC):
                 if self.aktif_birim.kategori in [LeksikolTip.DEGISKEN_ADI, LeksikolTip.NUMERIK_DEGER]:
-                    ifade_dugumu = SozdizimDugumu(DugumKategorisi.SABIT_DEGER, self.aktif_birim.icerik)
-                    kosul.alt_dugumler.append(ifade_dugumu)
+                    indeks = self._aktif_indeks()
+                    ifade_dugumu = self._dugum_olustur(DugumKategorisi.SABIT_DEGER, "{0}", indeks, indeks + 1)
+                    self._alt_ekle(kosul, ifade_dugumu)
                 self._ilerlet()
             
             if self._eslesme_kontrol(")", LeksikolTip.AYRAC):
                 self._ilerlet()
             
-            dugum.alt_dugumler.append(kosul)
+            self._alt_ekle(dugum, kosul)
         
         if self._eslesme_kontrol("{", LeksikolTip.AYRAC):
             govde = self._kod_blogu_cozumle()
-            if govde:
-                dugum.alt_dugumler.append(govde)
+            if govde is not None:
+                self._alt_ekle(dugum, govde)
         
         return dugum
     
-    def _while_cozumle(self) -> SozdizimDugumu:
+    def _while_cozumle(self) -> DugumTutamaci:
         """While döngüsü çözümler"""
-        dugum = SozdizimDugumu(DugumKategorisi.DONGU_WHILE, "While Döngüsü")
+        dugum = self._dugum_olustur(DugumKategorisi.DONGU_WHILE, "While Döngüsü")
         self._ilerlet()  # 'while' atla
         
         if self._eslesme_kontrol("(", LeksikolTip.AYRAC):
             self._ilerlet()
-            kosul = SozdizimDugumu(DugumKategorisi.MATEMATIK_IFADE, "Koşul")
+            kosul = self._dugum_olustur(DugumKategorisi.MATEMATIK_IFADE, "Koşul")
             # Koşul içeriğini basit çözümle
             while self.aktif_birim and not self._eslesme_kontrol(")", LeksikolTip.AYRAC):
                 self._ilerlet()
@@ -441,62 +1096,64 @@ class SozdizimCozumleyicisi:
             if self._eslesme_kontrol(")", LeksikolTip.AYRAC):
                 self._ilerlet()
             
-            dugum.alt_dugumler.append(kosul)
+            self._alt_ekle(dugum, kosul)
         
         if self._eslesme_kontrol("{", LeksikolTip.AYRAC):
             govde = self._kod_blogu_cozumle()
-            if govde:
-                dugum.alt_dugumler.append(govde)
+            if govde is not None:
+                self._alt_ekle(dugum, govde)
         
         return dugum
     
-    def _return_cozumle(self) -> SozdizimDugumu:
+    def _return_cozumle(self) -> DugumTutamaci:
         """Return ifadesi çözümler"""
-        dugum = SozdizimDugumu(DugumKategorisi.GERI_DONUS, "Return İfadesi")
+        dugum = self._dugum_olustur(DugumKategorisi.GERI_DONUS, "Return İfadesi")
         self._ilerlet()  # 'return' atla
         
         deger = self._ifade_degeri_cozumle()
-        if deger:
-            dugum.alt_dugumler.append(deger)
+        if deger is not None:
+            self._alt_ekle(dugum, deger)
         
         self._noktalıvirgule_kadar_atla()
         return dugum
     
-    def _ifade_degeri_cozumle(self) -> Optional[SozdizimDugumu]:
+    def _ifade_degeri_cozumle(self) -> Optional[DugumTutamaci]:
         """İfade değeri çözümler"""
         if self.aktif_birim is None:
             return None
         
+        indeks = self._aktif_indeks()
         if self.aktif_birim.kategori == LeksikolTip.DEGISKEN_ADI:
-            dugum = SozdizimDugumu(DugumKategorisi.KIMLIK_BELIRTECI, self.aktif_birim.icerik)
+            dugum = self._dugum_olustur(DugumKategorisi.KIMLIK_BELIRTECI, "{0}", indeks, indeks + 1)
             self._ilerlet()
             return dugum
         elif self.aktif_birim.kategori == LeksikolTip.NUMERIK_DEGER:
-            dugum = SozdizimDugumu(DugumKategorisi.SABIT_DEGER, self.aktif_birim.icerik)
+            dugum = self._dugum_olustur(DugumKategorisi.SABIT_DEGER, "{0}", indeks, indeks + 1)
             self._ilerlet()
             return dugum
         elif self.aktif_birim.kategori == LeksikolTip.DIZGI:
-            dugum = SozdizimDugumu(DugumKategorisi.SABIT_DEGER, self.aktif_birim.icerik)
+            dugum = self._dugum_olustur(DugumKategorisi.SABIT_DEGER, "{0}", indeks, indeks + 1)
             self._ilerlet()
             return dugum
         
         return None
     
-    def _basit_ifade_cozumle(self) -> Optional[SozdizimDugumu]:
+    def _basit_ifade_cozumle(self) -> Optional[DugumTutamaci]:
         """Basit ifade çözümler"""
         if self.aktif_birim is None:
             return None
         
-        ifade = SozdizimDugumu(DugumKategorisi.MATEMATIK_IFADE, "İfade")
+        ifade = self._dugum_olustur(DugumKategorisi.MATEMATIK_IFADE, "İfade")
         
         # Basit çözümleme
         while self.aktif_birim and not self._ifade_sonu_mu():
             if self.aktif_birim.kategori in [LeksikolTip.DEGISKEN_ADI, LeksikolTip.NUMERIK_DEGER]:
-                dugum = SozdizimDugumu(DugumKategorisi.SABIT_DEGER, self.aktif_birim.icerik)
-                ifade.alt_dugumler.append(dugum)
+                indeks = self._aktif_indeks()
+                dugum = self._dugum_olustur(DugumKategorisi.SABIT_DEGER, "{0}", indeks, indeks + 1)
+                self._alt_ekle(ifade, dugum)
             self._ilerlet()
         
-        return ifade if ifade.alt_dugumler else None
+        return ifade if self._alt_var_mi(ifade) else None
     
     def _noktalıvirgule_kadar_atla(self):
         """Noktalı virgüle kadar atla"""
@@ -512,12 +1169,37 @@ class SozdizimCozumleyicisi:
                 self._eslesme_kontrol("}", LeksikolTip.AYRAC))
 
 
+# Sözdizimi ağacını düz (arena) yapıda üreten çözümleyici
+class DuzSozdizimCozumleyicisi(SozdizimCozumleyicisi):
+    def __init__(self, leksikal_birimler: List[LeksikolBirim]):
+        super().__init__(leksikal_birimler)
+        self.agac = DuzSozdizimAgaci(self.leksikal_birimler)
+    
+    def _dugum_olustur(self, kategori: DugumKategorisi, bicim: str = "",
+                       baslangic: int = -1, bitis: int = -1) -> int:
+        """Düğümü arenaya ekler; metin biçimlendirmesi gösterime ertelenir"""
+        return self.agac.dugum_ekle(kategori, bicim, baslangic, bitis)
+    
+    def _alt_ekle(self, ebeveyn: int, cocuk: int):
+        self.agac.alt_dugum_ekle(ebeveyn, cocuk)
+    
+    def _alt_var_mi(self, dugum: int) -> bool:
+        return self.agac.ilk_cocuklar[dugum] != DuzSozdizimAgaci.BOS
+    
+    def kok_dugumu_cozumle(self) -> DuzSozdizimDugumu:
+        """Ağacı arenada kurar ve kökü SozdizimDugumu arayüzüyle (adaptör) döndürür"""
+        self.cozumle()
+        return self.agac.kok()
+
+
 # Sözdizimi ağacı görüntüleyici pencere sınıfı
 class SozdizimAgaciGorunumu(tk.Toplevel):
+    BASLIK = "Sözdizimi Ağacı"
+    
     def __init__(self, parent, renklendirici):
         super().__init__(parent)
         self.renklendirici = renklendirici
-        self.title("Sözdizimi Ağacı")
+        self.title(self.BASLIK)
         self.geometry("600x700")
         
         # Ağaç görüntüleyici oluştur
@@ -531,6 +1213,11 @@ class SozdizimAgaciGorunumu(tk.Toplevel):
         self.agac_widget.pack(side="left", fill="both", expand=True)
         kaydirma_cubugu.pack(side="right", fill="y")
         
+        # Çocukları henüz eklenmemiş öğeler: Treeview öğe kimliği -> düğüm kimliği
+        self.agac = None
+        self.bekleyen_dugumler: Dict[str, int] = {}
+        self.agac_widget.bind("<<TreeviewOpen>>", self._dugum_acildiginda)
+        
         self.agaci_yenile()
     
     def agaci_yenile(self):
@@ -539,22 +1226,49 @@ class SozdizimAgaciGorunumu(tk.Toplevel):
         for ogesi in self.agac_widget.get_children():
             self.agac_widget.delete(ogesi)
         
-        # Çözümleyiciyi çalıştır
-        cozumleyici = SozdizimCozumleyicisi(self.renklendirici.leksikal_birimler)
+        # Çözümleyiciyi çalıştır; büyük metinlerde yalnızca ilk GORUNUM_BIRIM_SINIRI birim çözümlenir
+        birimler = self.renklendirici.leksikal_birimler
+        if len(birimler) > GORUNUM_BIRIM_SINIRI:
+            self.title(f"{self.BASLIK} (ilk {GORUNUM_BIRIM_SINIRI} birim)")
+        else:
+            self.title(self.BASLIK)
+        cozumleyici = DuzSozdizimCozumleyicisi(birimler[:GORUNUM_BIRIM_SINIRI])
         kok_dugum = cozumleyici.cozumle()
+        self.agac = cozumleyici.agac
+        self.bekleyen_dugumler.clear()
         
-        # Ağacı oluştur
-        self._dugumu_agaca_ekle("", kok_dugum)
+        # Ağacı oluştur; yalnızca kök açık gösterilir, diğer düğümler açıldıkça doldurulur
+        kok_id = self._dugumu_agaca_ekle("", kok_dugum)
+        self._alt_dugumleri_ekle(kok_id)
+        self.agac_widget.item(kok_id, open=True)
     
-    def _dugumu_agaca_ekle(self, parent_id: str, dugum: SozdizimDugumu):
-        """Düğümü ağaca ekler"""
-        etiket = self.dugumKategorisiIsminiAl(dugum.kategori)
-        if dugum.deger:
-            etiket += f": {dugum.deger}"
+    def _dugumu_agaca_ekle(self, parent_id: str, dugum: int) -> str:
+        """Düğümü ağaca ekler; çocukları düğüm açılana kadar eklenmez"""
+        etiket = self.dugumKategorisiIsminiAl(self.agac.kategori(dugum))
+        deger = self.agac.deger(dugum)
+        if deger:
+            etiket += f": {deger}"
         
-        ogesi_id = self.agac_widget.insert(parent_id, "end", text=etiket, open=True)
+        ogesi_id = self.agac_widget.insert(parent_id, "end", text=etiket)
         
-        for alt_dugum in dugum.alt_dugumler:
+        if self.agac.ilk_cocuklar[dugum] != DuzSozdizimAgaci.BOS:
+            # Açma okunun görünmesi için yer tutucu bir çocuk eklenir
+            self.agac_widget.insert(ogesi_id, "end", text="...")
+            self.bekleyen_dugumler[ogesi_id] = dugum
+        return ogesi_id
+    
+    def _dugum_acildiginda(self, olay=None):
+        """Açılan öğenin çocuklarını ilk açılışta ağaca ekler"""
+        self._alt_dugumleri_ekle(self.agac_widget.focus())
+    
+    def _alt_dugumleri_ekle(self, ogesi_id: str):
+        """Yer tutucuyu kaldırıp düğümün çocuklarını ekler"""
+        dugum = self.bekleyen_dugumler.pop(ogesi_id, None)
+        if dugum is None:
+            return
+        
+        self.agac_widget.delete(*self.agac_widget.get_children(ogesi_id))
+        for alt_dugum in self.agac.alt_dugumler(dugum):
             self._dugumu_agaca_ekle(ogesi_id, alt_dugum)
     
     @staticmethod
@@ -585,9 +1299,12 @@ class SozdizimAgaciGorunumu(tk.Toplevel):
 
 # Merkezi uygulama arayüzü sınıfı
 class MerkeziPencere(tk.Tk):
+    PENCERE_BASLIGI = "C Dilinde Sözdizimi Renklendirici ve Çözümleme Aracı"
+    DOSYA_TURLERI = [("C Kaynak Dosyaları", "*.c *.h"), ("Tüm Dosyalar", "*.*")]
+    
     def __init__(self):
         super().__init__()
-        self.title("C Dilinde Sözdizimi Renklendirici ve Çözümleme Aracı")
+        self.title(self.PENCERE_BASLIGI)
         self.geometry("900x700")
         
         # Ana çerçeve
@@ -610,6 +1327,21 @@ class MerkeziPencere(tk.Tk):
         dugme_cercevesi = ttk.Frame(ana_cerceve)
         dugme_cercevesi.pack(fill="x", pady=(10, 0))
         
+        # Dosya düğmeleri
+        self.ac_dugme = ttk.Button(
+            dugme_cercevesi, 
+            text="Dosya Aç", 
+            command=self.dosya_ac
+        )
+        self.ac_dugme.pack(side="left", padx=(0, 10))
+        
+        self.kaydet_dugme = ttk.Button(
+            dugme_cercevesi, 
+            text="Kaydet", 
+            command=self.dosya_kaydet
+        )
+        self.kaydet_dugme.pack(side="left", padx=(0, 10))
+        
         # İşlev düğmeleri
         self.leksikal_dugme = ttk.Button(
             dugme_cercevesi, 
@@ -625,6 +1357,35 @@ class MerkeziPencere(tk.Tk):
         )
         self.sozdizimi_dugme.pack(side="left")
         
+        # Leksikal çözümleme yöntemi seçimi
+        self.leksikal_yontemleri = {
+            "Düzenli İfade": "duzenli_ifade",
+            "Karakter Tablosu": "tablo",
+        }
+        self.yontem_secimi = ttk.Combobox(
+            dugme_cercevesi,
+            values=list(self.leksikal_yontemleri),
+            state="readonly",
+            width=18
+        )
+        self.yontem_secimi.current(0)
+        self.yontem_secimi.pack(side="right")
+        self.yontem_secimi.bind("<<ComboboxSelected>>", self.leksikal_yontemi_degistir)
+        ttk.Label(dugme_cercevesi, text="Leksikal Yöntem:").pack(side="right", padx=(0, 5))
+        
+        # Yükleme/çözümleme ilerleme göstergesi (yalnızca işlem sürerken görünür)
+        self.ilerleme_cercevesi = ttk.Frame(ana_cerceve)
+        self.ilerleme_etiketi = ttk.Label(self.ilerleme_cercevesi)
+        self.ilerleme_etiketi.pack(side="left")
+        self.ilerleme_cubugu = ttk.Progressbar(self.ilerleme_cercevesi, maximum=100)
+        self.ilerleme_cubugu.pack(side="left", fill="x", expand=True, padx=10)
+        self.iptal_dugme = ttk.Button(
+            self.ilerleme_cercevesi, 
+            text="İptal", 
+            command=self.islemi_iptal_et
+        )
+        self.iptal_dugme.pack(side="right")
+        
         # Sözdizimi renklendirici
         self.renklendirici = SozdizimRenklendiricisi(self.kod_editoru)
         
@@ -632,9 +1393,23 @@ class MerkeziPencere(tk.Tk):
         self.leksikal_penceresi = None
         self.sozdizimi_penceresi = None
         
+        # Dosya ve arka plan işlemleri durumu
+        self.dosya_yolu = None
+        self.satir_sonu = "\n"         # Kaydederken kullanılan satır sonu
+        self.bozuk_kaynak_yolu = None   # UTF-8 olarak okunamayan, üzerine yazılmaması gereken dosya
+        self.dosya_okuyucu = None
+        self.yukleme_gorevi = None
+        self.artimli_analiz = None
+        self.analiz_gorevi = None
+        self.erteleme_gorevi = None
+        self.buyuk_metin_mi = False
+        
         # Olay bağlantıları
         self.kod_editoru.bind('<KeyRelease>', self.icerik_degistiginde)
         self.kod_editoru.bind('<Button-1>', self.icerik_degistiginde)
+        for olay_adi, islev in (('<Control-o>', self.dosya_ac), ('<Control-s>', self.dosya_kaydet)):
+            self.bind(olay_adi, islev)
+            self.kod_editoru.bind(olay_adi, islev)  # Text sınıfının varsayılan bağlantısını ezer
         
         # Örnek kaynak kod yükle
         self.varsayilan_kod_yukle()
@@ -644,18 +1419,264 @@ class MerkeziPencere(tk.Tk):
     
     def icerik_degistiginde(self, olay=None):
         """Editör içeriği değiştiğinde çağrılan işlev"""
+        if self.dosya_okuyucu is not None:
+            return  # Yükleme sürerken tam çözümleme yapılmaz
+        
+        # Metni değiştirmeyen olaylar (imleç tıklamaları, ok tuşları) çözümleme gerektirmez
+        if olay is not None and not self.kod_editoru.edit_modified():
+            return
+        
+        # Büyük metinlerde her tuş vuruşunda metnin tamamı alınmaz; yazma durunca çözümlenir
+        if olay is not None and self.buyuk_metin_mi:
+            if self.erteleme_gorevi is not None:
+                self.after_cancel(self.erteleme_gorevi)
+            self.erteleme_gorevi = self.after(ERTELEME_SURESI_MS, self._icerigi_cozumle)
+            return
+        
+        self._icerigi_cozumle()
+    
+    def _icerigi_cozumle(self):
+        """Editör içeriğini çözümler ve renklendirir"""
+        if self.erteleme_gorevi is not None:
+            self.after_cancel(self.erteleme_gorevi)
+            self.erteleme_gorevi = None
+        if self.dosya_okuyucu is not None:
+            return
+        
         try:
-            self.renklendirici.leksikal_analiz_yap()
-            self.renklendirici.renklendirmeyi_uygula()
+            kaynak_metin = self.kod_editoru.get("1.0", tk.END)
+            self.kod_editoru.edit_modified(False)
+            
+            # Büyük metinler arayüzü kilitlememek için arka planda çözümlenir
+            self.buyuk_metin_mi = len(kaynak_metin) > BUYUK_METIN_SINIRI
+            if self.buyuk_metin_mi:
+                self._arka_plan_analizini_baslat(kaynak_metin)
+                return
             
-            # Yardımcı pencereleri güncelle
-            if self.leksikal_penceresi and self.leksikal_penceresi.winfo_exists():
+            self._analizi_durdur()
+            self.artimli_analiz = None
+            self.renklendirici.metni_ayristir(kaynak_metin)
+            self.renklendirici.renklendirmeyi_uygula()
+            self._yardimci_pencereleri_guncelle()
+                
+        except Exception as hata:
+            print(f"İşlem hatası: {hata}")
+    
+    def _yardimci_pencereleri_guncelle(self):
+        """Açık yardımcı pencereleri güncel leksikal birimlerle yeniler"""
+        # Büyük metinlerde pencereler kendiliğinden yenilenmez (Treeview doldurmak arayüzü
+        # kilitler); eskidikleri başlıkta belirtilir, ilgili düğmeyle istenince yenilenirler
+        if self.leksikal_penceresi and self.leksikal_penceresi.winfo_exists():
+            if self.buyuk_metin_mi:
+                self.leksikal_penceresi.title(f"{LeksikolAnalizGorunumu.BASLIK} (güncel değil)")
+            else:
                 self.leksikal_penceresi.veriyi_guncelle()
-            if self.sozdizimi_penceresi and self.sozdizimi_penceresi.winfo_exists():
+        if self.sozdizimi_penceresi and self.sozdizimi_penceresi.winfo_exists():
+            if self.buyuk_metin_mi:
+                self.sozdizimi_penceresi.title(f"{SozdizimAgaciGorunumu.BASLIK} (güncel değil)")
+            else:
                 self.sozdizimi_penceresi.agaci_yenile()
-                
+    
+    def _arka_plan_analizini_baslat(self, kaynak_metin: str):
+        """Metni after() ile zamanlanan kısa adımlarla çözümlemeye başlar"""
+        analiz = self.artimli_analiz
+        if (analiz is not None and analiz.kaynak_metin == kaynak_metin
+                and analiz.leksikal_yontem == self.renklendirici.leksikal_yontem):
+            return  # Aynı metin zaten çözümlendi, çözümleniyor veya iptal edildi
+        
+        self._analizi_durdur()
+        self.artimli_analiz = ArtimliLeksikalAnaliz(self.renklendirici, kaynak_metin, analiz)
+        
+        # Çözümleme görünen bölgenin gerisinden başlıyorsa o bölge beklemeden renklendirilir;
+        # satır başından başlandığı için yaklaşıktır, asıl geçiş bölgeye ulaşınca düzeltilir
+        gorunur_baslangic = self._karakter_konumu("@0,0 linestart")
+        if self.artimli_analiz.konum < gorunur_baslangic:
+            gorunur_bitis = self._karakter_konumu(f"@0,{self.kod_editoru.winfo_height()} lineend")
+            birimler, son_konum = self.renklendirici.parca_ayristir(
+                kaynak_metin, gorunur_baslangic, gorunur_bitis)
+            self.renklendirici.araligi_renklendir(
+                birimler, SatirSutunCevirici(kaynak_metin), gorunur_baslangic, son_konum)
+        
+        self._ilerlemeyi_goster("Çözümleniyor...")
+        self.analiz_gorevi = self.after_idle(self._sonraki_analiz_adimi)
+    
+    def _karakter_konumu(self, indeks: str) -> int:
+        """Tk indeksini metnin başından itibaren karakter konumuna çevirir"""
+        sonuc = self.kod_editoru.count("1.0", indeks, "chars")
+        if not sonuc:
+            return 0
+        return sonuc[0] if isinstance(sonuc, tuple) else sonuc
+    
+    def _sonraki_analiz_adimi(self):
+        """Arka plan çözümlemesinin bir adımını çalıştırır ve sonrakini zamanlar"""
+        analiz = self.artimli_analiz
+        try:
+            analiz.adim_at()
         except Exception as hata:
             print(f"İşlem hatası: {hata}")
+            self._analizi_durdur()
+            return
+        
+        self.ilerleme_cubugu["value"] = analiz.ilerleme() * 100
+        if analiz.tamamlandi_mi():
+            self.analiz_gorevi = None
+            self._ilerlemeyi_gizle()
+            self.renklendirici.leksikal_birimler[:] = analiz.leksikal_birimler
+            self._yardimci_pencereleri_guncelle()
+        else:
+            self.analiz_gorevi = self.after(1, self._sonraki_analiz_adimi)
+    
+    def _analizi_durdur(self):
+        """Zamanlanmış arka plan çözümleme adımını iptal eder"""
+        if self.analiz_gorevi is not None:
+            self.after_cancel(self.analiz_gorevi)
+            self.analiz_gorevi = None
+            self._ilerlemeyi_gizle()
+    
+    def dosya_ac(self, olay=None):
+        """Seçilen dosyayı parça parça editöre yükler"""
+        dosya_yolu = filedialog.askopenfilename(parent=self, title="Dosya Aç", filetypes=self.DOSYA_TURLERI)
+        if not dosya_yolu:
+            return "break"
+        
+        self._yuklemeyi_bitir()
+        self._analizi_durdur()
+        try:
+            self.dosya_okuyucu = ParcaliDosyaOkuyucu(dosya_yolu)
+        except (OSError, ValueError) as hata:
+            messagebox.showerror("Dosya Hatası", f"Dosya açılamadı:\n{hata}", parent=self)
+            return "break"
+        
+        self.dosya_yolu = dosya_yolu
+        self.bozuk_kaynak_yolu = None
+        self._basligi_guncelle(dosya_yolu)
+        self.artimli_analiz = None
+        self.renklendirici.leksikal_birimler.clear()
+        self.kod_editoru.delete("1.0", tk.END)
+        self.kod_editoru.configure(state="disabled")  # Yükleme sırasında düzenleme yapılamaz
+        self._ilerlemeyi_goster("Yükleniyor...")
+        self.yukleme_gorevi = self.after_idle(self._sonraki_parcayi_yukle)
+        return "break"
+    
+    def _sonraki_parcayi_yukle(self):
+        """Dosyanın bir sonraki parçasını editöre ekler ve sonrakini zamanlar"""
+        okuyucu = self.dosya_okuyucu
+        ilk_parca_mi = okuyucu.konum == 0
+        parca = okuyucu.sonraki_parca()
+        
+        self.kod_editoru.configure(state="normal")
+        self.kod_editoru.insert(tk.END, parca)
+        self.kod_editoru.configure(state="disabled")
+        
+        if okuyucu.kodlama_hatasi and self.bozuk_kaynak_yolu is None:
+            self._kodlama_hatasini_bildir()
+        
+        # Görünen ilk bölüm, dosyanın geri kalanı beklenmeden renklendirilir
+        if ilk_parca_mi:
+            gorunum = parca[:ILK_GORUNUM_BOYUTU]
+            birimler, son_konum = self.renklendirici.parca_ayristir(gorunum, 0, len(gorunum))
+            self.renklendirici.araligi_renklendir(birimler, SatirSutunCevirici(gorunum), 0, son_konum)
+        
+        self.ilerleme_cubugu["value"] = okuyucu.ilerleme() * 100
+        if okuyucu.bitti_mi():
+            self.yukleme_gorevi = None
+            self._yuklemeyi_bitir()
+            self.icerik_degistiginde()
+        else:
+            self.yukleme_gorevi = self.after(1, self._sonraki_parcayi_yukle)
+    
+    def _kodlama_hatasini_bildir(self):
+        """Geçersiz UTF-8 içeren dosyanın kaydederken üzerine yazılmasını engeller"""
+        self.bozuk_kaynak_yolu = self.dosya_yolu
+        self.dosya_yolu = None
+        self._basligi_guncelle(self.bozuk_kaynak_yolu, "UTF-8 değil")
+        messagebox.showwarning(
+            "Kodlama Uyarısı",
+            "Dosya geçerli UTF-8 değil; okunamayan baytlar \ufffd ile gösteriliyor.\n"
+            "Özgün dosyanın bozulmaması için kaydederken yeni bir dosya adı istenecek.",
+            parent=self
+        )
+    
+    def _yuklemeyi_bitir(self):
+        """Süren dosya yüklemesini sonlandırır ve editörü düzenlemeye açar"""
+        if self.yukleme_gorevi is not None:
+            self.after_cancel(self.yukleme_gorevi)
+            self.yukleme_gorevi = None
+        if self.dosya_okuyucu is not None:
+            self.satir_sonu = self.dosya_okuyucu.satir_sonu or "\n"
+            self.dosya_okuyucu.kapat()
+            self.dosya_okuyucu = None
+            self.kod_editoru.configure(state="normal")
+            self._ilerlemeyi_gizle()
+    
+    def islemi_iptal_et(self):
+        """Süren yükleme veya arka plan çözümlemesini iptal eder"""
+        if self.dosya_okuyucu is not None:
+            # Editörde dosyanın yalnızca bir kısmı var; kaydetme kaynağın üzerine yazmamalı.
+            # Kodlama hatası bildirildiyse dosya_yolu zaten boşaltılmış, yol bozuk_kaynak_yolu'ndadır
+            yarim_kalan_dosya = self.dosya_yolu or self.bozuk_kaynak_yolu
+            durum = "eksik yüklendi" if self.bozuk_kaynak_yolu is None else "UTF-8 değil, eksik yüklendi"
+            self.dosya_yolu = None
+            self._yuklemeyi_bitir()
+            self._basligi_guncelle(yarim_kalan_dosya, durum)
+            self.icerik_degistiginde()  # Yüklenebilen kısım çözümlenir
+        else:
+            self._analizi_durdur()
+    
+    def dosya_kaydet(self, olay=None):
+        """Editör içeriğini dosyaya kaydeder"""
+        if self.dosya_okuyucu is not None:
+            messagebox.showwarning("Kaydet", "Dosya yüklenirken kaydetme yapılamaz.", parent=self)
+            return "break"
+        
+        dosya_yolu = self.dosya_yolu
+        if dosya_yolu is None:
+            dosya_yolu = filedialog.asksaveasfilename(
+                parent=self, title="Kaydet", defaultextension=".c", filetypes=self.DOSYA_TURLERI)
+            if not dosya_yolu:
+                return "break"
+        
+        if (self.bozuk_kaynak_yolu is not None
+                and os.path.abspath(dosya_yolu) == os.path.abspath(self.bozuk_kaynak_yolu)):
+            messagebox.showerror(
+                "Kaydet",
+                "Bu dosya UTF-8 olarak okunamadı; üzerine yazmak özgün baytları bozar.\n"
+                "Lütfen farklı bir dosya adı seçin.",
+                parent=self
+            )
+            return "break"
+        
+        try:
+            # Satır sonları yüklenen dosyadaki biçimle, her platformda aynı şekilde yazılır
+            with open(dosya_yolu, "w", encoding="utf-8", newline=self.satir_sonu) as dosya:
+                dosya.write(self.kod_editoru.get("1.0", "end-1c"))
+        except OSError as hata:
+            messagebox.showerror("Dosya Hatası", f"Dosya kaydedilemedi:\n{hata}", parent=self)
+            return "break"
+        
+        self.dosya_yolu = dosya_yolu
+        self._basligi_guncelle(dosya_yolu)
+        return "break"
+    
+    def _basligi_guncelle(self, dosya_yolu: Optional[str], durum: str = None):
+        """Pencere başlığında dosya adını ve varsa editör içeriğinin durumunu gösterir"""
+        baslik = os.path.basename(dosya_yolu) if dosya_yolu else "Adsız"
+        if durum:
+            baslik += f" ({durum})"
+        self.title(f"{baslik} - {self.PENCERE_BASLIGI}")
+    
+    def _ilerlemeyi_goster(self, mesaj: str):
+        self.ilerleme_etiketi.configure(text=mesaj)
+        self.ilerleme_cubugu["value"] = 0
+        self.ilerleme_cercevesi.pack(fill="x", pady=(10, 0))
+    
+    def _ilerlemeyi_gizle(self):
+        self.ilerleme_cercevesi.pack_forget()
+    
+    def leksikal_yontemi_degistir(self, olay=None):
+        """Seçilen leksikal çözümleme yöntemine geçer ve içeriği yeniden çözümler"""
+        self.renklendirici.leksikal_yontem = self.leksikal_yontemleri[self.yontem_secimi.get()]
+        self.icerik_degistiginde()
     
     def leksikal_gorunumu_ac(self):
         """Leksikal çözümleme penceresini görüntüle"""
@@ -675,45 +1696,7 @@ class MerkeziPencere(tk.Tk):
     
     def varsayilan_kod_yukle(self):
         """Varsayılan C kaynak kodunu editöre yerleştirir"""
-        demo_kod = '''// Bu satır tek satırlık açıklama içerir
-/* Aşağıdaki blok
-   çoklu satır
-   açıklama örneğidir */
-
-#include <stdio.h>
-#include <stdlib.h>
-
-char ileti[] = "Selam Dünya!";
-int deger = 42;
-float pi_sayisi = 3.14159;
-char harf = 'X';
-
-int islev_calistir(int a, float b) {
-    if (a > 0 && b < 100.0) {
-        char durum[] = "Olumlu";
-        return a + (int)b;
-    } else {
-        while (a != 0) {
-            a = a - 1;
-            b = b * 2.0;
-        }
-        for (int j = 0; j < 10; j++) {
-            float toplam = a + b;
-            if (toplam >= 50.0) {
-                break;
-            }
-        }
-    }
-    return 0;
-}
-
-int main() {
-    int sonuc = islev_calistir(5, 10.5);
-    printf("Çıktı: %d\\n", sonuc);
-    return 0;
-}
-'''
-        self.kod_editoru.insert("1.0", demo_kod)
+        self.kod_editoru.insert("1.0", VARSAYILAN_KAYNAK_KOD)
 
 
 if __name__ == "__main__":